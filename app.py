@@ -1,11 +1,17 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import aiohttp
 from PIL import Image, ImageDraw, ImageFont
 import io
 import base64
+import hashlib
 from datetime import datetime
+from types import MappingProxyType
 import os
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 # Set page configuration
 st.set_page_config(
@@ -16,7 +22,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -38,22 +44,300 @@ st.markdown("""
         border-left: 5px solid #1976D2;
         margin: 1rem 0;
     }
-    .download-button {
-        background-color: #4CAF50;
-        color: white;
-        padding: 0.5rem 1rem;
-        border: none;
-        border-radius: 5px;
-        cursor: pointer;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def main():
-    # Header
+def _inject_css():
+    # Emitted on every run: cached functions can't replay elements onto
+    # the page container, and elements not re-drawn disappear on rerun.
+    # Base colors live in .streamlit/config.toml; only the custom
+    # classes remain as CSS.
+    st.html(_CSS)
+
+@st.fragment
+def _render_header():
     st.markdown('<h1 class="main-header">🎨 Mandala Art Generator</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Transform words into beautiful, printable Mandala artwork</p>', unsafe_allow_html=True)
-    
+
+@st.fragment
+def _render_sidebar_instructions(show_getting_started):
+    if show_getting_started:
+        st.markdown("""
+        <div class="instruction-box">
+            <h4>🚀 Getting Started:</h4>
+            <ol>
+                <li>Get your OpenAI API key from <a href="https://platform.openai.com/api-keys" target="_blank">OpenAI Platform</a></li>
+                <li>Enter the API key in the field above</li>
+                <li>Type an inspiring word</li>
+                <li>Generate your unique Mandala!</li>
+            </ol>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("### 📋 About")
+    st.markdown("""
+    This app generates beautiful Mandala-style artwork perfect for:
+    - Coloring books
+    - Meditation art
+    - Decorative prints
+    - Therapeutic coloring
+    """)
+
+    st.markdown("### ⚙️ Features")
+    st.markdown("""
+    - High-resolution output
+    - Print-ready formats
+    - Black & white line art
+    - Symmetrical designs
+    - Instant download
+    """)
+
+@st.fragment
+def _render_footer_tips():
+    st.markdown("---")
+    st.markdown("### 🖨️ Printing Tips")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        **📄 Paper Recommendations:**
+        - Heavy paper (200-300gsm)
+        - Smooth or lightly textured
+        - White or cream colored
+        - A4 or Letter size
+        """)
+
+    with col2:
+        st.markdown("""
+        **🖊️ Coloring Tools:**
+        - Colored pencils
+        - Fine-tip markers
+        - Gel pens
+        - Watercolor pencils
+        """)
+
+    with col3:
+        st.markdown("""
+        **⚙️ Print Settings:**
+        - Highest quality mode
+        - 300 DPI or higher
+        - No scaling/fit to page
+        - Black ink only
+        """)
+
+# Base prompt structure (word is interpolated per call)
+_BASE_PROMPT_TMPL = """Create a beautiful, symmetrical Mandala artwork inspired by the word '%s'.
+    The design should be in black and white line art style, perfect for coloring books."""
+
+# Complexity variations (frozen so they can't be mutated at runtime)
+COMPLEXITY_PROMPTS = MappingProxyType({
+    "Simple": "Use clean, simple geometric patterns with wide spaces for easy coloring. Minimal detail, bold lines.",
+    "Moderate": "Include moderate detail with traditional mandala elements like circles, petals, and geometric shapes.",
+    "Detailed": "Create intricate patterns with fine details, multiple layers, and complex geometric arrangements.",
+    "Very Detailed": "Design an extremely detailed mandala with very fine lines, multiple concentric circles, and elaborate patterns."
+})
+
+# Style variations
+STYLE_PROMPTS = MappingProxyType({
+    "Traditional Mandala": "Follow traditional Sanskrit mandala design principles with circular symmetry, lotus petals, and sacred geometry.",
+    "Geometric Patterns": "Focus on geometric shapes, mathematical patterns, triangles, hexagons, and angular designs.",
+    "Nature-Inspired": "Incorporate natural elements like flowers, leaves, vines, and organic flowing patterns.",
+    "Abstract Designs": "Create abstract, flowing patterns with curved lines and artistic interpretations."
+})
+
+# Technical specifications
+TECHNICAL_SPECS = """
+    IMPORTANT: The artwork must be:
+    - Pure black lines on white background
+    - High contrast for clear printing
+    - Perfectly symmetrical (8-fold or 12-fold radial symmetry)
+    - No shading, gradients, or gray tones
+    - Clean, printable line art style
+    - Suitable for coloring with pens, pencils, or markers
+    """
+
+@st.cache_resource(show_spinner=False)
+def _get_client(api_key: str) -> OpenAI:
+    """Build the OpenAI client once per API key and reuse it across reruns."""
+    return OpenAI(api_key=api_key)
+
+@st.cache_resource(show_spinner=False)
+def _get_http_session() -> requests.Session:
+    """Shared keep-alive session so downloads reuse TCP/TLS connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+async def _fetch(url):
+    """Download a URL asynchronously and return the raw bytes."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            return await response.read()
+
+def _api_key_fingerprint(api_key):
+    """Short stable digest of the API key, safe to use in cache keys.
+
+    The leading-underscore params below keep the raw key out of
+    Streamlit's hashing entirely; this 8-byte fingerprint is what
+    discriminates cached entries per user without writing key-derived
+    material into the persisted cache.
+    """
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
+@st.cache_data(
+    show_spinner=False,
+    persist="disk",
+    max_entries=200,
+    ttl=30 * 24 * 3600
+)
+def _generate_png_bytes(_api_key, api_key_fingerprint, word, complexity, style, image_size, _status=None):
+    """Generate a Mandala and return it as PNG bytes.
+
+    Cached to disk so repeat requests for the same inputs skip the
+    DALL-E round-trip and PNG re-encode even across app restarts.
+    When a st.status container is passed it receives per-step updates.
+    """
+    client = _get_client(_api_key)
+    prompt = create_mandala_prompt(word, complexity, style)
+
+    # Generate image using the latest OpenAI API
+    if _status is not None:
+        _status.update(label="🖌️ Calling DALL-E...")
+    response = _generate_with_retry(
+        client,
+        model="dall-e-3",  # Using DALL-E 3 for better quality
+        prompt=prompt,
+        size=image_size,
+        quality="hd",  # High quality for printing
+        n=1
+    )
+
+    # Get the image URL
+    image_url = response.data[0].url
+
+    # Stream the download straight into the PNG decoder instead of
+    # materializing the multi-MB payload as an intermediate bytes object
+    if _status is not None:
+        _status.update(label="⬇️ Downloading image...")
+    image_response = _get_http_session().get(image_url, stream=True, timeout=30)
+    image_response.raw.decode_content = True
+    image = Image.open(image_response.raw)
+    image.load()
+
+    # Encode once; the same bytes feed st.image and the download button
+    if _status is not None:
+        _status.update(label="🗜️ Encoding PNG...")
+    return _encode_png(image)
+
+_BACKOFF_WAIT = wait_exponential_jitter(initial=1, max=30)
+
+def _retry_after_or_backoff(retry_state):
+    """Honor the server's Retry-After header when present, else back off.
+
+    RateLimitError carries the HTTP response; a 429 usually says
+    exactly how long to wait, which beats guessing with exponential
+    backoff. Capped at 60s so a pathological header can't stall the UI.
+    """
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+    return _BACKOFF_WAIT(retry_state)
+
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    wait=_retry_after_or_backoff,
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+def _generate_with_retry(client, **kwargs):
+    """Call images.generate, retrying transient rate-limit and connection errors."""
+    return client.images.generate(**kwargs)
+
+async def _generate_many_async(client, prompts, image_size):
+    """Fan out one DALL-E call per prompt and download results concurrently.
+
+    A semaphore keeps at most 5 requests in flight so we stay inside
+    typical rate limits while still overlapping the network waits.
+    """
+    semaphore = asyncio.Semaphore(5)
+
+    async def _gen_one(prompt):
+        async with semaphore:
+            response = await asyncio.to_thread(
+                _generate_with_retry,
+                client,
+                model="dall-e-3",
+                prompt=prompt,
+                size=image_size,
+                quality="hd",
+                n=1
+            )
+            return await _fetch(response.data[0].url)
+
+    return await asyncio.gather(*[_gen_one(prompt) for prompt in prompts])
+
+def _encode_png(image):
+    """Encode a PIL image to PNG bytes with the fast compression profile.
+
+    No mode conversion: PNG supports RGBA natively, so forcing RGB
+    would only allocate a pointless full-size copy.
+    """
+    buf = io.BytesIO()
+    image.save(buf, format='PNG', compress_level=1)
+    return buf.getvalue()
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=8,
+    ttl=3600
+)
+def _generate_png_bytes_batch(_api_key, api_key_fingerprint, word, complexity, style, image_size, n):
+    """Generate n Mandala variations concurrently, returned as PNG bytes."""
+    client = _get_client(_api_key)
+    prompt = create_mandala_prompt(word, complexity, style)
+    contents = asyncio.run(_generate_many_async(client, [prompt] * n, image_size))
+    return [_encode_png(Image.open(io.BytesIO(content))) for content in contents]
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=8,
+    ttl=3600
+)
+def _generate_style_comparison(_api_key, api_key_fingerprint, word, complexity, image_size):
+    """Generate one Mandala per art style in a single concurrent fan-out."""
+    client = _get_client(_api_key)
+    styles = list(STYLE_PROMPTS)
+    prompts = [create_mandala_prompt(word, complexity, s) for s in styles]
+    contents = asyncio.run(_generate_many_async(client, prompts, image_size))
+    return [
+        (style, _encode_png(Image.open(io.BytesIO(content))))
+        for style, content in zip(styles, contents)
+    ]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _downscale_png(png_bytes):
+    """Re-encode PNG bytes with the longest edge capped at 1024px.
+
+    Uses Lanczos resampling so the web preview stays crisp while the
+    download shrinks roughly 4x for wide/tall sizes.
+    """
+    image = Image.open(io.BytesIO(png_bytes))
+    image.thumbnail((1024, 1024), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    image.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+def main():
+    # Inject styling and header once per run
+    _inject_css()
+    _render_header()
+
     # Sidebar for API key and instructions
     with st.sidebar:
         st.markdown("### 🔑 OpenAI API Setup")
@@ -62,90 +346,83 @@ def main():
             type="password",
             help="Get your API key from https://platform.openai.com/api-keys"
         )
-        
-        if not api_key:
-            st.markdown("""
-            <div class="instruction-box">
-                <h4>🚀 Getting Started:</h4>
-                <ol>
-                    <li>Get your OpenAI API key from <a href="https://platform.openai.com/api-keys" target="_blank">OpenAI Platform</a></li>
-                    <li>Enter the API key in the field above</li>
-                    <li>Type an inspiring word</li>
-                    <li>Generate your unique Mandala!</li>
-                </ol>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("### 📋 About")
-        st.markdown("""
-        This app generates beautiful Mandala-style artwork perfect for:
-        - Coloring books
-        - Meditation art
-        - Decorative prints
-        - Therapeutic coloring
-        """)
-        
-        st.markdown("### ⚙️ Features")
-        st.markdown("""
-        - High-resolution output
-        - Print-ready formats
-        - Black & white line art
-        - Symmetrical designs
-        - Instant download
-        """)
-    
+
+        _render_sidebar_instructions(show_getting_started=not api_key)
+
     # Main content area
     col1, col2 = st.columns([1, 1])
     
     with col1:
         st.markdown("### 💡 Enter Your Inspiration Word")
-        word = st.text_input(
-            "Type a word that inspires you:",
-            placeholder="e.g., peace, love, nature, harmony...",
-            help="Choose any word that resonates with you. The AI will create a Mandala inspired by its meaning and energy."
+
+        # Lives outside the form so toggling it immediately disables
+        # the controls it overrides
+        compare_styles = st.checkbox(
+            "🎭 Compare all 4 styles",
+            help="Generate one Mandala per art style concurrently and compare them side by side"
         )
-        
-        # Advanced options
-        with st.expander("🎨 Advanced Options"):
-            complexity = st.select_slider(
-                "Complexity Level:",
-                options=["Simple", "Moderate", "Detailed", "Very Detailed"],
-                value="Moderate",
-                help="Choose how intricate you want your Mandala to be"
-            )
-            
-            style = st.selectbox(
-                "Art Style:",
-                ["Traditional Mandala", "Geometric Patterns", "Nature-Inspired", "Abstract Designs"],
-                help="Select the artistic style for your Mandala"
+
+        # A form batches all input widgets into a single rerun on
+        # submit, so keystrokes in the word box no longer re-execute
+        # the whole script
+        with st.form("gen_form"):
+            word = st.text_input(
+                "Type a word that inspires you:",
+                placeholder="e.g., peace, love, nature, harmony...",
+                help="Choose any word that resonates with you. The AI will create a Mandala inspired by its meaning and energy."
             )
-            
-            size = st.selectbox(
-                "Image Size:",
-                ["1024x1024 (Standard)", "1792x1024 (Wide)", "1024x1792 (Tall)"],
-                help="Choose the dimensions for your Mandala"
+
+            # Advanced options
+            with st.expander("🎨 Advanced Options"):
+                complexity = st.select_slider(
+                    "Complexity Level:",
+                    options=["Simple", "Moderate", "Detailed", "Very Detailed"],
+                    value="Moderate",
+                    help="Choose how intricate you want your Mandala to be"
+                )
+
+                style = st.selectbox(
+                    "Art Style:",
+                    ["Traditional Mandala", "Geometric Patterns", "Nature-Inspired", "Abstract Designs"],
+                    disabled=compare_styles,
+                    help="Select the artistic style for your Mandala (disabled while comparing all 4 styles)"
+                )
+
+                size = st.selectbox(
+                    "Image Size:",
+                    ["1024x1024 (Standard)", "1792x1024 (Wide)", "1024x1792 (Tall)"],
+                    help="Choose the dimensions for your Mandala"
+                )
+
+                num_images = st.slider(
+                    "Number of Variations:",
+                    min_value=1,
+                    max_value=4,
+                    value=1,
+                    disabled=compare_styles,
+                    help="Generate several variations concurrently and pick your favorite (disabled while comparing all 4 styles)"
+                )
+
+                bandwidth_saver = st.checkbox(
+                    "Bandwidth-saver preview",
+                    help="Also offer a downscaled (max 1024px) PNG that is much smaller to download"
+                )
+
+            # Generate button (submits the whole form in one rerun)
+            generate_button = st.form_submit_button(
+                "🎨 Generate Mandala",
+                type="primary",
+                help="Click to create your unique Mandala artwork"
             )
-        
-        # Generate button
-        generate_button = st.button(
-            "🎨 Generate Mandala",
-            type="primary",
-            disabled=not (api_key and word),
-            help="Click to create your unique Mandala artwork"
-        )
     
     with col2:
         st.markdown("### 🖼️ Your Generated Mandala")
         
         if generate_button and api_key and word:
-            with st.spinner("🎨 Creating your beautiful Mandala... This may take a moment."):
                 try:
-                    # Initialize OpenAI client
-                    client = OpenAI(api_key=api_key)
-                    
                     # Create detailed prompt for Mandala generation
                     prompt = create_mandala_prompt(word, complexity, style)
-                    
+
                     # Parse size
                     if "1792x1024" in size:
                         image_size = "1792x1024"
@@ -153,56 +430,98 @@ def main():
                         image_size = "1024x1792"
                     else:
                         image_size = "1024x1024"
-                    
-                    # Generate image using the latest OpenAI API
-                    response = client.images.generate(
-                        model="dall-e-3",  # Using DALL-E 3 for better quality
-                        prompt=prompt,
-                        size=image_size,
-                        quality="hd",  # High quality for printing
-                        n=1
-                    )
-                    
-                    # Get the image URL
-                    image_url = response.data[0].url
-                    
-                    # Download and display the image
-                    image_response = requests.get(image_url)
-                    image = Image.open(io.BytesIO(image_response.content))
-                    
-                    # Display the image
-                    st.image(image, caption=f"Mandala inspired by: {word.title()}", use_column_width=True)
-                    
-                    # Convert to high-quality format for download
-                    buf = io.BytesIO()
-                    # Ensure RGB mode for PNG
-                    if image.mode != 'RGB':
-                        image = image.convert('RGB')
-                    image.save(buf, format='PNG', quality=95, optimize=True)
-                    buf.seek(0)
-                    
-                    # Create download button
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"mandala_{word}_{timestamp}.png"
-                    
-                    st.download_button(
-                        label="📥 Download High-Res PNG",
-                        data=buf.getvalue(),
-                        file_name=filename,
-                        mime="image/png",
-                        help="Download your Mandala in high resolution for printing"
-                    )
-                    
+
+                    # One clock read for both the filename stamp and the
+                    # human-readable details line
+                    now = datetime.now()
+                    timestamp = now.strftime("%Y%m%d_%H%M%S")
+                    generated_at = now.strftime("%Y-%m-%d %H:%M:%S")
+                    key_fingerprint = _api_key_fingerprint(api_key)
+
+                    # Generate inside a status box that streams per-step
+                    # progress; results render below once it completes
+                    with st.status("🎨 Creating your beautiful Mandala...", expanded=True) as status:
+                        if compare_styles:
+                            # One image per style, fanned out concurrently
+                            status.update(label="🎭 Generating all 4 styles concurrently...")
+                            comparison = _generate_style_comparison(api_key, key_fingerprint, word, complexity, image_size)
+                        elif num_images == 1:
+                            # Generate (or fetch from cache) the PNG bytes
+                            png_bytes = _generate_png_bytes(api_key, key_fingerprint, word, complexity, style, image_size, _status=status)
+                        else:
+                            # Fan out the variations concurrently
+                            status.update(label=f"🎨 Generating {num_images} variations concurrently...")
+                            batch = _generate_png_bytes_batch(api_key, key_fingerprint, word, complexity, style, image_size, num_images)
+
+                        status.update(label="✅ Mandala ready!", state="complete", expanded=False)
+
+                    if compare_styles:
+                        grid = st.columns(len(comparison))
+                        for cell, (style_name, png_bytes) in zip(grid, comparison):
+                            with cell:
+                                st.image(png_bytes, caption=style_name, width="stretch")
+                                st.download_button(
+                                    label="📥 PNG",
+                                    data=png_bytes,
+                                    file_name=f"mandala_{word}_{timestamp}_{style_name.lower().replace(' ', '_')}.png",
+                                    mime="image/png",
+                                    key=f"download_style_{style_name}"
+                                )
+                    elif num_images == 1:
+                        # Display the image
+                        st.image(png_bytes, caption=f"Mandala inspired by: {word.title()}", width="stretch")
+
+                        # Create download button
+                        filename = f"mandala_{word}_{timestamp}.png"
+
+                        st.download_button(
+                            label="📥 Download High-Res PNG",
+                            data=png_bytes,
+                            file_name=filename,
+                            mime="image/png",
+                            help="Download your Mandala in high resolution for printing"
+                        )
+
+                        if bandwidth_saver:
+                            st.download_button(
+                                label="📥 Download Web Preview PNG",
+                                data=_downscale_png(png_bytes),
+                                file_name=f"mandala_{word}_{timestamp}_preview.png",
+                                mime="image/png",
+                                help="Smaller downscaled version for sharing or quick previews"
+                            )
+                    else:
+                        grid = st.columns(len(batch))
+                        for index, (cell, png_bytes) in enumerate(zip(grid, batch), start=1):
+                            with cell:
+                                st.image(png_bytes, caption=f"Variation {index}", width="stretch")
+                                st.download_button(
+                                    label=f"📥 PNG #{index}",
+                                    data=png_bytes,
+                                    file_name=f"mandala_{word}_{timestamp}_{index}.png",
+                                    mime="image/png",
+                                    key=f"download_variation_{index}"
+                                )
+
                     # Display generation details
                     with st.expander("📊 Generation Details"):
                         st.write(f"**Word:** {word.title()}")
-                        st.write(f"**Style:** {style}")
+                        if compare_styles:
+                            st.write("**Style:** All 4 styles (side-by-side comparison)")
+                        else:
+                            st.write(f"**Style:** {style}")
                         st.write(f"**Complexity:** {complexity}")
                         st.write(f"**Size:** {image_size}")
-                        st.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                        
-                        st.markdown("**Prompt Used:**")
-                        st.code(prompt, language="text")
+                        st.write(f"**Generated:** {generated_at}")
+
+                        if compare_styles:
+                            st.markdown("**Prompts Used:**")
+                            for style_name in STYLE_PROMPTS:
+                                st.markdown(f"*{style_name}:*")
+                                st.code(create_mandala_prompt(word, complexity, style_name), language="text")
+                        else:
+                            st.markdown("**Prompt Used:**")
+                            st.code(prompt, language="text")
                     
                 except Exception as e:
                         st.error(f"❌ Error generating Mandala: {str(e)}")
@@ -220,76 +539,17 @@ def main():
             st.info("💡 Please enter an inspiring word to generate your Mandala.")
     
     # Footer with printing tips
-    st.markdown("---")
-    st.markdown("### 🖨️ Printing Tips")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **📄 Paper Recommendations:**
-        - Heavy paper (200-300gsm)
-        - Smooth or lightly textured
-        - White or cream colored
-        - A4 or Letter size
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🖊️ Coloring Tools:**
-        - Colored pencils
-        - Fine-tip markers
-        - Gel pens
-        - Watercolor pencils
-        """)
-    
-    with col3:
-        st.markdown("""
-        **⚙️ Print Settings:**
-        - Highest quality mode
-        - 300 DPI or higher
-        - No scaling/fit to page
-        - Black ink only
-        """)
+    _render_footer_tips()
 
+@st.cache_data(max_entries=256)
 def create_mandala_prompt(word, complexity, style):
     """Create a detailed prompt for Mandala generation"""
-    
-    # Base prompt structure
-    base_prompt = f"""Create a beautiful, symmetrical Mandala artwork inspired by the word '{word}'. 
-    The design should be in black and white line art style, perfect for coloring books."""
-    
-    # Complexity variations
-    complexity_prompts = {
-        "Simple": "Use clean, simple geometric patterns with wide spaces for easy coloring. Minimal detail, bold lines.",
-        "Moderate": "Include moderate detail with traditional mandala elements like circles, petals, and geometric shapes.",
-        "Detailed": "Create intricate patterns with fine details, multiple layers, and complex geometric arrangements.",
-        "Very Detailed": "Design an extremely detailed mandala with very fine lines, multiple concentric circles, and elaborate patterns."
-    }
-    
-    # Style variations
-    style_prompts = {
-        "Traditional Mandala": "Follow traditional Sanskrit mandala design principles with circular symmetry, lotus petals, and sacred geometry.",
-        "Geometric Patterns": "Focus on geometric shapes, mathematical patterns, triangles, hexagons, and angular designs.",
-        "Nature-Inspired": "Incorporate natural elements like flowers, leaves, vines, and organic flowing patterns.",
-        "Abstract Designs": "Create abstract, flowing patterns with curved lines and artistic interpretations."
-    }
-    
-    # Technical specifications
-    technical_specs = """
-    IMPORTANT: The artwork must be:
-    - Pure black lines on white background
-    - High contrast for clear printing
-    - Perfectly symmetrical (8-fold or 12-fold radial symmetry)
-    - No shading, gradients, or gray tones
-    - Clean, printable line art style
-    - Suitable for coloring with pens, pencils, or markers
-    """
-    
-    # Combine all elements
-    full_prompt = f"{base_prompt} {complexity_prompts[complexity]} {style_prompts[style]} {technical_specs}"
-    
-    return full_prompt
+    return " ".join((
+        _BASE_PROMPT_TMPL % word,
+        COMPLEXITY_PROMPTS[complexity],
+        STYLE_PROMPTS[style],
+        TECHNICAL_SPECS
+    ))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file